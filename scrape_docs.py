@@ -13,7 +13,7 @@ import sys
 import requests
 import re  # Added for regex URL extraction
 import os  # Added for directory creation
-from urllib.parse import urlparse, urljoin  # Added urljoin back
+from urllib.parse import urlparse, urljoin, urldefrag  # Added urljoin back
 from bs4 import BeautifulSoup  # Added BeautifulSoup
 # from markdownify import markdownify # Replaced with html2text
 import html2text # Added html2text
@@ -24,10 +24,57 @@ from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 from pythonjsonlogger import jsonlogger  # Added for structured logging
 from tqdm import tqdm  # Added for progress bar
+import time  # Added for HTTP/2 retry backoff
+import cProfile  # Added for --profile
+import pstats  # Added for merging per-thread profiles
+import tracemalloc  # Added for memory snapshots
+try:
+    import httpx  # Optional: HTTP/2 transport (--http2)
+except ImportError:
+    httpx = None
 # Placeholder for fcntl (if needed later for locking)
 
 # --- Constants ---
 # TODO: Move configuration like retry counts, backoff factor, etc. here
+HTTP2_RETRIES = 3  # Same total as the requests Retry (errors and statuses)
+HTTP2_BACKOFF_FACTOR = 1  # Same 0s, 2s, 4s backoff as urllib3's Retry
+HTTP2_RETRY_STATUSES = [500, 502, 503, 504]
+
+# Shared HTTP/2 client, created by setup_http2_client() when --http2 is set
+http2_client = None
+
+# Stages summarized from the merged profile: (label, file suffix, function name)
+PROFILE_STAGES = [
+    ("fetch", "scrape_docs.py", "fetch_url_content"),
+    ("html parsing (bs4/lxml)", os.path.join("bs4", "__init__.py"), "__init__"),
+    ("link rewriting", "scrape_docs.py", "absolutize_links"),
+    ("image rewriting", "scrape_docs.py", "convert_images_to_markdown"),
+    ("html2text", os.path.join("html2text", "__init__.py"), "handle"),
+    ("checklist update (incl. lock wait)", "scrape_docs.py", "update_checklist_file"),
+    ("logging output", os.path.join("logging", "__init__.py"), "emit"),
+]
+
+# Per-thread profilers, collected by run_with_profiler() when --profile is set
+# Python 3.12+ allows only one active cProfile profiler per interpreter, so
+#  there the main thread's profiler is the single profile for all threads
+PER_THREAD_PROFILING = sys.version_info < (3, 12)
+profiling_enabled = False
+thread_profiles = []
+thread_profiles_lock = threading.Lock()
+
+LINK_CHECK_TIMEOUT = 10
+LINK_CHECK_RETRIES = 2  # Fewer than page fetches; a report entry is cheap
+LINK_CHECK_BACKOFF_FACTOR = 0.5
+
+# Shared link target cache (target URL -> set of pages referencing it),
+#  filled by record_link_targets() when --verify-links is set
+link_verification_enabled = False
+link_targets = {}
+link_reference_count = 0
+# Fetch outcomes of crawled pages (URL -> (status_code, error)), so links to
+#  them are not requested again during verification
+crawled_page_results = {}
+link_targets_lock = threading.Lock()
 
 
 # --- Logging Setup ---
@@ -104,6 +151,17 @@ def get_h1_from_url(url):
         return None
 
 
+def positive_int(value):
+    """argparse type for options that must be an integer of at least 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: '{value}'")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
 def parse_arguments():
     """Parses command-line arguments."""
     parser = argparse.ArgumentParser(
@@ -131,11 +189,155 @@ def parse_arguments():
         default=5,
         help="Number of concurrent worker threads (default: 5)"
     )
+    parser.add_argument(
+        "--http2",
+        action="store_true",
+        help="Fetch pages over a shared HTTP/2 client (requires httpx[http2]; "
+        "brotli/zstandard enable br/zstd compression)"
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Collect cProfile data from all threads into a merged "
+        "<base_name>_profile.pstats file in the output directory"
+    )
+    parser.add_argument(
+        "--tracemalloc-interval",
+        type=float,
+        default=0,
+        help="Seconds between tracemalloc snapshots of the top allocators, "
+        "written to <base_name>_tracemalloc.md (default: 0, disabled)"
+    )
+    parser.add_argument(
+        "--tracemalloc-top",
+        type=int,
+        default=10,
+        help="Number of allocation sites per tracemalloc snapshot (default: 10)"
+    )
+    parser.add_argument(
+        "--verify-links",
+        action="store_true",
+        help="Check every unique link and image target after the crawl and "
+        "write <base_name>_link_report.md to the output directory"
+    )
+    parser.add_argument(
+        "--link-check-workers",
+        type=positive_int,
+        default=10,
+        help="Number of concurrent link checker threads (default: 10)"
+    )
     return parser.parse_args()
 
 
+# --- HTTP/2 Transport ---
+
+
+def setup_http2_client(max_connections):
+    """Creates the shared HTTP/2 client used by fetch_url_content.
+
+    A single httpx client is shared by all worker threads so that concurrent
+    requests to the same docs host are multiplexed as streams over a few
+    connections. The pool allows max_connections (one per worker thread) so
+    hosts that only speak HTTP/1.1 never leave a worker waiting. httpx
+    advertises br/zstd in Accept-Encoding when the brotli/zstandard packages
+    are installed. Returns False if httpx or h2 is unavailable, in which case
+    the requests (HTTP/1.1) path is used.
+    """
+    global http2_client
+    if httpx is None:
+        logging.error("--http2 requested but httpx is not installed. Falling back to HTTP/1.1. [EC:1006]")
+        return False
+    try:
+        import h2  # noqa: F401  # Required by httpx for HTTP/2 support
+    except ImportError:
+        logging.error("--http2 requested but h2 is not installed (pip install 'httpx[http2]'). Falling back to HTTP/1.1. [EC:1006]")
+        return False
+
+    limits = httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=max_connections
+    )
+    # No transport-level retries; fetch_url_content_http2 retries transport
+    #  errors and 5xx statuses in one loop, like the requests Retry total
+    transport = httpx.HTTPTransport(http2=True, limits=limits)
+    http2_client = httpx.Client(
+        transport=transport,
+        # No pool timeout: waiting for a free connection must not skip a page
+        timeout=httpx.Timeout(10, pool=None),
+        follow_redirects=True  # Match requests' default redirect handling
+    )
+    logging.info(f"HTTP/2 client initialized (max connections: {max_connections}).")
+    return True
+
+
+def close_http2_client():
+    """Closes the shared HTTP/2 client, if one was created."""
+    global http2_client
+    if http2_client is not None:
+        http2_client.close()
+        http2_client = None
+        logging.info("HTTP/2 client closed.")
+
+
+def fetch_url_content_http2(url):
+    """Fetches content from a given URL using the shared HTTP/2 client.
+
+    Transport errors (connect/read failures, timeouts, dropped connections
+    such as an HTTP/2 GOAWAY) and 5xx statuses share one retry budget, as
+    with the requests path.
+    """
+    logging.info(f"Fetching content over HTTP/2 from: {url}")
+    try:
+        for attempt in range(HTTP2_RETRIES + 1):
+            try:
+                response = http2_client.get(url)
+            except httpx.TransportError as e:
+                # Unsupported schemes will never succeed, so don't retry them
+                if isinstance(e, httpx.UnsupportedProtocol) or attempt == HTTP2_RETRIES:
+                    raise
+                retry_reason = f"{type(e).__name__}: {e}"
+            else:
+                if response.status_code not in HTTP2_RETRY_STATUSES or attempt == HTTP2_RETRIES:
+                    break
+                retry_reason = f"status {response.status_code}"
+            # urllib3 Retry backoff: no delay before the first retry
+            delay = 0 if attempt == 0 else HTTP2_BACKOFF_FACTOR * (2 ** attempt)
+            logging.debug(f"Retrying {url} after {retry_reason} in {delay}s")
+            time.sleep(delay)
+        # Raise HTTPStatusError for bad responses (4xx or 5xx)
+        response.raise_for_status()
+        logging.debug(
+            f"Fetched {url} via {response.http_version} "
+            f"(content-encoding: {response.headers.get('content-encoding', 'identity')})"
+        )
+        # Explicitly decode using UTF-8, replacing errors
+        content = response.content.decode('utf-8', errors='replace')
+        logging.info(f"Successfully fetched and decoded content from: {url}")
+        return content
+    except httpx.TimeoutException as e:
+        logging.error(f"Timeout fetching {url}: {e} [EC:1001]")
+        return None
+    except httpx.ConnectError as e:
+        logging.error(f"Connection error fetching {url}: {e} [EC:1002]")
+        return None
+    except httpx.HTTPStatusError as e:
+        logging.warning(f"HTTP error fetching {url}: {e.response.status_code} [EC:1003]")
+        return None
+    except httpx.HTTPError as e:
+        # Catch other potential transport/protocol exceptions
+        logging.error(f"General request error fetching {url}: {e} [EC:1000]")
+        return None
+    except httpx.InvalidURL as e:
+        # Not an HTTPError subclass; return None like the requests path does
+        logging.error(f"Invalid URL {url}: {e} [EC:1005]")
+        return None
+
+
 def fetch_url_content(url):
     """Fetches content from a given URL with retry logic."""
+    if http2_client is not None:
+        return fetch_url_content_http2(url)
+
     # Configure retry strategy
     retry_strategy = Retry(
         total=3,  # Total number of retries
@@ -328,6 +530,53 @@ def update_checklist_file(checklist_filepath, url_to_check, lock):
                 )
 
 
+# --- HTML Rewriting Helpers ---
+
+
+def absolutize_links(soup, url):
+    """Converts all <a> hrefs in the soup to absolute URLs.
+    Returns the list of absolute hrefs."""
+    absolute_hrefs = []
+    for a_tag in soup.find_all('a', href=True):
+        original_href = a_tag['href']
+        absolute_href = urljoin(url, original_href)
+        a_tag['href'] = absolute_href
+        absolute_hrefs.append(absolute_href)
+        # logging.debug(f"Converted link: {original_href} -> {absolute_href}")  # Optional debug
+    return absolute_hrefs
+
+
+def convert_images_to_markdown(soup, url):
+    """Replaces <img> tags with Markdown image links using absolute src URLs.
+    Returns the list of absolute src URLs."""
+    # image_placeholders = {} # No longer needed
+    absolute_srcs = []
+    for img_tag in soup.find_all('img'):
+        original_src = img_tag.get('src')
+        if not original_src:
+            logging.warning(f"Skipping img tag with no src in {url}")
+            continue  # Skip images without src
+
+        absolute_src = urljoin(url, original_src)
+        absolute_srcs.append(absolute_src)
+        # Default alt text if missing, sanitize for Markdown
+        alt_text = img_tag.get('alt', '')
+        # Basic sanitization for alt text (e.g., remove brackets that might break Markdown)
+        alt_text = alt_text.replace('[', '').replace(']', '').replace('(', '').replace(')', '')
+
+        # Generate standard Markdown image link for ALL images
+        markdown_image_tag = f"![{alt_text}]({absolute_src})"
+        logging.debug(f"Generated Markdown for image: {markdown_image_tag}")
+
+        # Replace the img tag in the soup *directly* with the final markdown tag
+        # This avoids placeholder replacement issues after markdownify
+        img_tag.replace_with(markdown_image_tag)
+        logging.debug(
+            f"Replaced img tag {original_src} with Markdown: {markdown_image_tag}"
+            )
+    return absolute_srcs
+
+
 # --- URL Processing Function ---
 
 
@@ -344,6 +593,8 @@ def process_single_url(
 
     success = False  # Track overall success for this URL
     html_content = fetch_url_content(url)
+    if link_verification_enabled:
+        record_crawled_page(url, None if html_content else "Fetch failed during crawl")
     if not html_content:
         # fetch_url_content already logged the specific error
         logging.warning(f"Skipping URL due to fetch error: {url}")
@@ -353,36 +604,14 @@ def process_single_url(
         soup = BeautifulSoup(html_content, 'lxml')
 
         # --- Foundational Step: Convert Links ---
-        for a_tag in soup.find_all('a', href=True):
-            original_href = a_tag['href']
-            absolute_href = urljoin(url, original_href)
-            a_tag['href'] = absolute_href
-            # logging.debug(f"Converted link: {original_href} -> {absolute_href}")  # Optional debug
+        link_urls = absolutize_links(soup, url)
 
         # --- Refactored Image Handling (Uniform) ---
-        # image_placeholders = {} # No longer needed
-        for img_tag in soup.find_all('img'):
-            original_src = img_tag.get('src')
-            if not original_src:
-                logging.warning(f"Skipping img tag with no src in {url}")
-                continue  # Skip images without src
-
-            absolute_src = urljoin(url, original_src)
-            # Default alt text if missing, sanitize for Markdown
-            alt_text = img_tag.get('alt', '')
-            # Basic sanitization for alt text (e.g., remove brackets that might break Markdown)
-            alt_text = alt_text.replace('[', '').replace(']', '').replace('(', '').replace(')', '')
-
-            # Generate standard Markdown image link for ALL images
-            markdown_image_tag = f"![{alt_text}]({absolute_src})"
-            logging.debug(f"Generated Markdown for image: {markdown_image_tag}")
-
-            # Replace the img tag in the soup *directly* with the final markdown tag
-            # This avoids placeholder replacement issues after markdownify
-            img_tag.replace_with(markdown_image_tag)
-            logging.debug(
-                f"Replaced img tag {original_src} with Markdown: {markdown_image_tag}"
-                )
+        image_urls = convert_images_to_markdown(soup, url)
+
+        # --- Collect Targets for Link Verification (optional) ---
+        if link_verification_enabled:
+            record_link_targets(url, link_urls + image_urls)
 
         # --- Remove any remaining img tags (e.g., those without src) BEFORE markdownify ---
         # Note: The previous loop already skipped tags without src, but decompose handles any stragglers
@@ -457,6 +686,262 @@ def process_single_url(
         return None, None
 
 
+# --- Profiling ---
+
+
+def run_with_profiler(target, *args):
+    """Runs target(*args), collecting cProfile data for this thread if
+    per-thread profiling is enabled."""
+    if not profiling_enabled or not PER_THREAD_PROFILING:
+        return target(*args)
+
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        return target(*args)
+    finally:
+        profiler.disable()
+        with thread_profiles_lock:
+            thread_profiles.append(profiler)
+
+
+def write_profile_report(main_profiler, filepath):
+    """Merges the main and per-thread profiles, dumps them to a pstats file,
+    and logs cumulative time per processing stage.
+
+    With per-thread profiling, stage times are thread-seconds summed across
+    threads. Otherwise (Python 3.12+) they come from one profiler that mixes
+    all threads into a single call stack and are only wall-clock estimates.
+    """
+    try:
+        stats = pstats.Stats(main_profiler)
+        with thread_profiles_lock:
+            for profiler in thread_profiles:
+                stats.add(profiler)
+        stats.dump_stats(filepath)
+        logging.info(f"Wrote merged profile to: {filepath}")
+    except IOError as e:
+        logging.error(f"Error writing profile file {filepath}: {e} [EC:5002]")
+        return
+
+    if PER_THREAD_PROFILING:
+        time_unit = "thread-seconds summed across threads"
+    else:
+        time_unit = "wall-clock, all threads mixed in one profile"
+    for label, file_suffix, func_name in PROFILE_STAGES:
+        total_time = 0.0
+        total_calls = 0
+        for (filename, _, name), (_, calls, _, cumulative, _) in stats.stats.items():
+            if name == func_name and filename.endswith(file_suffix):
+                total_time += cumulative
+                total_calls += calls
+        logging.info(f"Profile stage '{label}': {total_time:.3f}s cumulative ({time_unit}) over {total_calls} calls")
+
+
+def write_tracemalloc_snapshot(filepath, top_n):
+    """Appends the top allocation sites of a tracemalloc snapshot to a file."""
+    snapshot = tracemalloc.take_snapshot().filter_traces((
+        tracemalloc.Filter(False, tracemalloc.__file__),
+    ))
+    top_stats = snapshot.statistics('lineno')[:top_n]
+    current, peak = tracemalloc.get_traced_memory()
+    timestamp_ms = datetime.now().strftime('%Y-%m-%d %H:%M:%S.%f')[:-3]
+    try:
+        with open(filepath, 'a', encoding='utf-8') as f:
+            f.write(f"## Snapshot {timestamp_ms} (current: {current / 1024:.1f} KiB, peak: {peak / 1024:.1f} KiB)\n\n")
+            for stat in top_stats:
+                f.write(f"- {stat}\n")
+            f.write("\n")
+        logging.debug(f"Wrote tracemalloc snapshot to: {filepath}")
+    except IOError as e:
+        logging.error(f"Error writing tracemalloc snapshot {filepath}: {e} [EC:5002]")
+
+
+def tracemalloc_sampler(filepath, interval, top_n, stop_event):
+    """Thread function that writes a tracemalloc snapshot every interval
+    seconds until stop_event is set."""
+    while not stop_event.wait(interval):
+        write_tracemalloc_snapshot(filepath, top_n)
+
+
+# --- Link Verification ---
+
+
+def record_link_targets(page_url, targets):
+    """Adds the http(s) link/image targets found on page_url to the shared
+    cache, keyed by URL without fragment so repeated targets are checked once."""
+    global link_reference_count
+    normalized = []
+    for target in targets:
+        target = urldefrag(target)[0]
+        if urlparse(target).scheme in ("http", "https"):
+            normalized.append(target)
+
+    with link_targets_lock:
+        link_reference_count += len(normalized)
+        for target in normalized:
+            link_targets.setdefault(target, set()).add(page_url)
+
+
+def record_crawled_page(page_url, error):
+    """Records the crawl's fetch outcome for page_url in the shared cache so
+    verification reuses it instead of requesting the page again."""
+    with link_targets_lock:
+        # fetch_url_content does not expose the status code, only success
+        crawled_page_results[urldefrag(page_url)[0]] = (None, error)
+
+
+def create_link_check_session(pool_size):
+    """Creates a requests session whose connection pool is shared by all
+    link checker threads."""
+    retry_strategy = Retry(
+        total=LINK_CHECK_RETRIES,
+        backoff_factor=LINK_CHECK_BACKOFF_FACTOR,
+        connect=0,  # Dead hosts and timeouts are reported right away
+        read=0,
+        status_forcelist=[500, 502, 503, 504],
+        allowed_methods=["HEAD", "GET"],
+        raise_on_status=False  # Report the final status instead of raising
+    )
+    adapter = HTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        max_retries=retry_strategy
+    )
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def check_link_target(session, target):
+    """Checks a link target with HEAD, falling back to GET if HEAD returns an
+    error status (some servers reject or mishandle HEAD, e.g. 403/404/405).
+    Connection errors and timeouts are reported without a GET retry.
+    Returns (status_code, error)."""
+    try:
+        response = session.head(target, timeout=LINK_CHECK_TIMEOUT, allow_redirects=True)
+        if response.status_code < 400:
+            return response.status_code, None
+        logging.debug(f"HEAD returned {response.status_code} for {target}. Retrying with GET.")
+        # stream=True avoids downloading the body; only the status is needed
+        with session.get(target, timeout=LINK_CHECK_TIMEOUT, allow_redirects=True, stream=True) as response:
+            if response.status_code < 400:
+                return response.status_code, None
+            return response.status_code, f"HTTP {response.status_code}"
+    except requests.exceptions.Timeout:
+        return None, "Timeout"
+    except requests.exceptions.ConnectionError:
+        return None, "Connection error"
+    except requests.exceptions.RequestException as e:
+        return None, f"Request error: {e}"
+
+
+def link_checker_thread(check_queue, session, results, results_lock, pbar):
+    """Worker thread function to check link targets from the queue."""
+    while True:
+        try:
+            target = check_queue.get_nowait()
+        except queue.Empty:
+            break
+        try:
+            status_code, error = check_link_target(session, target)
+            with results_lock:
+                results[target] = (status_code, error)
+            if error:
+                logging.debug(f"Broken link target {target}: {error}")
+        except Exception as e:
+            logging.error(f"Unexpected error checking link target {target}: {e} [EC:9001]", exc_info=True)
+        finally:
+            check_queue.task_done()
+            pbar.update(1)
+
+
+def verify_link_targets(num_workers):
+    """Checks all unique targets in the shared link cache concurrently,
+    reusing the crawl's outcome for targets that are crawled pages.
+    Returns a dict of target -> (status_code, error)."""
+    targets = []
+    results = {}
+    with link_targets_lock:
+        for target in link_targets:
+            if target in crawled_page_results:
+                results[target] = crawled_page_results[target]
+            else:
+                targets.append(target)
+    logging.info(
+        f"Verifying {len(targets)} unique link targets "
+        f"({link_reference_count} references, {len(results)} already fetched "
+        f"during the crawl) with {num_workers} threads."
+    )
+
+    check_queue = queue.Queue()
+    for target in targets:
+        check_queue.put(target)
+    results_lock = threading.Lock()
+    session = create_link_check_session(num_workers)
+    pbar = tqdm(total=len(targets), desc="Verifying links", unit="link")
+
+    checker_threads = []
+    for i in range(num_workers):
+        thread = threading.Thread(
+            target=run_with_profiler,
+            args=(link_checker_thread, check_queue, session, results, results_lock, pbar),
+            name=f"LinkChecker-{i+1}",
+            daemon=True
+        )
+        checker_threads.append(thread)
+        thread.start()
+    for thread in checker_threads:
+        thread.join()
+
+    pbar.close()
+    session.close()
+    return results
+
+
+def write_link_report(base_name, filepath, results):
+    """Writes a Markdown link health report listing broken targets and the
+    pages that reference them. Targets without a result are listed as
+    unchecked rather than counted as healthy."""
+    broken = sorted(target for target, (_, error) in results.items() if error)
+    with link_targets_lock:
+        unchecked = sorted(target for target in link_targets if target not in results)
+    logging.info(f"Writing link health report: {filepath}")
+    try:
+        with open(filepath, 'w', encoding='utf-8') as f:
+            f.write(f"# Link Health Report for {base_name}\n\n")
+            f.write(f"- Link and image references: {link_reference_count}\n")
+            f.write(f"- Unique targets found: {len(link_targets)}\n")
+            f.write(f"- Unique targets checked: {len(results)}\n")
+            f.write(f"- Targets already fetched during the crawl: {len(crawled_page_results.keys() & results.keys())}\n")
+            f.write(f"- Broken targets: {len(broken)}\n")
+            f.write(f"- Unchecked targets: {len(unchecked)}\n\n")
+            f.write("## Broken Targets\n\n")
+            if not broken:
+                f.write("None.\n")
+            for target in broken:
+                f.write(f"### {target}\n\n")
+                f.write(f"{results[target][1]}. Referenced from:\n\n")
+                for page_url in sorted(link_targets.get(target, ())):
+                    f.write(f"- {page_url}\n")
+                f.write("\n")
+            if unchecked:
+                f.write("## Unchecked Targets\n\n")
+                for target in unchecked:
+                    f.write(f"- {target}\n")
+        if unchecked:
+            logging.warning(f"{len(unchecked)} link targets were not checked. See {filepath}")
+        if broken:
+            logging.warning(f"Found {len(broken)} broken link targets out of {len(results)}. See {filepath}")
+        elif not unchecked:
+            logging.info(f"All {len(results)} link targets are healthy.")
+        return True
+    except IOError as e:
+        logging.error(f"Error writing link report {filepath}: {e} [EC:5002]")
+        return False
+
+
 # --- Writer Thread Function ---
 
 def writer_thread(write_queue):
@@ -561,8 +1046,32 @@ def main():
     setup_logging()
     args = parse_arguments()
 
+    # Profiling is opt-in; when disabled the only cost is one flag check per thread
+    global profiling_enabled
+    main_profiler = None
+    if args.profile:
+        profiling_enabled = True
+        main_profiler = cProfile.Profile()
+        main_profiler.enable()
+        if PER_THREAD_PROFILING:
+            logging.info("Profiling enabled (per-thread profiles).")
+        else:
+            logging.warning("Profiling enabled with a single profiler for all threads (Python 3.12+). Stage times are wall-clock with threads mixed.")
+    if args.tracemalloc_interval > 0:
+        tracemalloc.start()
+        logging.info(f"tracemalloc enabled (interval: {args.tracemalloc_interval}s).")
+
+    global link_verification_enabled
+    link_verification_enabled = args.verify_links
+
     logging.info(f"Starting scrape process for URL tree: {args.tree_url}") # Reverted log message
 
+    num_worker_threads = 5  # Configurable number of threads
+
+    if args.http2:
+        # Logs and falls back to HTTP/1.1 on failure
+        setup_http2_client(num_worker_threads)
+
     # 1. Fetch the markdown tree content
     markdown_content = fetch_url_content(args.tree_url)
     if not markdown_content:
@@ -637,7 +1146,6 @@ def main():
     write_queue = queue.Queue() # Create the write queue
     checklist_lock = threading.Lock()
     worker_threads = [] # Rename for clarity
-    num_worker_threads = 5  # Configurable number of threads
     total_urls = len(valid_urls)
 
     # Initialize tqdm progress bar
@@ -649,16 +1157,31 @@ def main():
 
     logging.info(f"Populated URL queue with {total_urls} URLs.")
 
+    # Start the tracemalloc sampler thread
+    tracemalloc_filepath = os.path.join(output_root_dir, f"{base_name}_tracemalloc.md")
+    sampler_stop = threading.Event()
+    sampler = None
+    if tracemalloc.is_tracing():
+        sampler = threading.Thread(
+            target=tracemalloc_sampler,
+            args=(tracemalloc_filepath, args.tracemalloc_interval, args.tracemalloc_top, sampler_stop),
+            name="TracemallocSampler",
+            daemon=True
+        )
+        sampler.start()
+        logging.info("Started tracemalloc sampler thread.")
+
     # Start the writer thread
-    writer = threading.Thread(target=writer_thread, args=(write_queue,), name="WriterThread", daemon=True)
+    writer = threading.Thread(target=run_with_profiler, args=(writer_thread, write_queue), name="WriterThread", daemon=True)
     writer.start()
     logging.info("Started writer thread.")
 
     # Start worker threads
     for i in range(num_worker_threads):
         thread = threading.Thread(
-            target=worker,
+            target=run_with_profiler,
             args=(
+                worker,
                 url_queue,
                 base_name,
                 output_dir,
@@ -688,11 +1211,37 @@ def main():
     write_queue.join()
     logging.info("Writer queue empty.")
 
-    # Wait for the writer thread to finish (optional as it's daemon, but good practice)
-    # writer.join() # Not strictly necessary for daemon thread
+    # Wait for all threads to finish so their profiles are collected
+    for thread in worker_threads:
+        thread.join()
+    writer.join()
 
     # Close the progress bar
     pbar.close()
+    close_http2_client()
+
+    # Verify collected link/image targets (optional)
+    if link_verification_enabled:
+        link_results = verify_link_targets(args.link_check_workers)
+        write_link_report(
+            base_name,
+            os.path.join(output_root_dir, f"{base_name}_link_report.md"),
+            link_results
+        )
+
+    if tracemalloc.is_tracing():
+        sampler_stop.set()
+        if sampler is not None:
+            sampler.join()
+        write_tracemalloc_snapshot(tracemalloc_filepath, args.tracemalloc_top)  # Final snapshot
+        tracemalloc.stop()
+        logging.info(f"Wrote tracemalloc snapshots to: {tracemalloc_filepath}")
+    if main_profiler is not None:
+        main_profiler.disable()
+        write_profile_report(
+            main_profiler,
+            os.path.join(output_root_dir, f"{base_name}_profile.pstats")
+        )
     logging.info("Scraping process finished.")
 
 